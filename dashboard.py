@@ -1,26 +1,186 @@
 """
 Swiss Trader Dashboard - Live Portfolio Viewer
-Run: python3 dashboard.py
-Open: http://localhost:5000
+Run: gunicorn -w 2 --threads 8 -k gthread -b 0.0.0.0:5050 dashboard:app
+Dev: python3 dashboard.py
+Open: http://localhost:5050
+
+Each gunicorn worker keeps its own price and JSON caches; they warm up
+independently after the first refresh, and each worker then keeps the prices
+it has been asked for fresh in a background thread. Last-known prices are also saved to
+.price_cache.json so a restart doesn't start cold.
+
+Styles come from static/dashboard.css, built from tailwind.css:
+    tailwindcss -i tailwind.css -o static/dashboard.css --minify
+
+Behind a reverse proxy, serve / straight from static/index.html (written on
+startup) and only proxy /api/ to gunicorn, e.g. for nginx:
+    gzip on;
+    gzip_types text/html text/css application/json;
+    location = / { root /path/to/escherbot/static; try_files /index.html =404; add_header Cache-Control no-cache; }
+    location /static/ { root /path/to/escherbot; expires 1h; }
+    location /api/ { proxy_pass http://127.0.0.1:5050; }
 """
 import os
+import re
 import json
-from flask import Flask, jsonify, render_template_string
-import yfinance as yf
+import hashlib
+import time
+import threading
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+import numpy as np
+import orjson
+from curl_cffi import requests as curl_requests
+from flask import Flask, request
+from flask_compress import Compress
 
 app = Flask(__name__)
+# Trades/history/reports are highly repetitive JSON, so compress responses on the wire.
+# text/event-stream is deliberately not in COMPRESS_MIMETYPES: Flask-Compress only
+# flushes its compressor when a stream ends, which would hold SSE events back.
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+# / and /static/ are sent as file streams; compress them the same way, and re-check
+# If-None-Match against the "<etag>:<algorithm>" tag Flask-Compress gives them
+app.config["COMPRESS_ALGORITHM_STREAMING"] = ["br", "gzip"]
+app.config["COMPRESS_STREAMING_ENDPOINT_CONDITIONAL"] = ["static", "index"]
+app.config["COMPRESS_MIN_SIZE"] = 512
+Compress(app)
 PORTFOLIO_FILE = "portfolio.json"
 NEWS_MEMORY_FILE = "news_memory.json"
+MAX_FETCH_WORKERS = 16  # Max concurrent Yahoo requests per refresh
+FETCH_TIMEOUT = 10      # Seconds to wait on pooled fetches, or on another thread's fetch
+QUOTE_CHUNK_SIZE = 20   # Symbols per direct Yahoo quote request
+YAHOO_SPARK_URL = "https://query1.finance.yahoo.com/v7/finance/spark"
+QUOTE_TIMEOUT = 5       # Seconds to wait on a direct Yahoo quote request
+# Seconds a fetched quote is reused before refetching (override with PRICE_CACHE_TTL=...)
+PRICE_CACHE_TTL = float(os.environ.get("PRICE_CACHE_TTL", 30))
+if not 0 < PRICE_CACHE_TTL < float("inf"):  # also rejects NaN
+    raise ValueError(f"PRICE_CACHE_TTL must be a positive number of seconds, got {PRICE_CACHE_TTL}")
+PRICE_CACHE_FILE = ".price_cache.json"  # Last-known prices, kept across restarts
+PRICE_DISK_MAX_AGE = 5 * PRICE_CACHE_TTL  # Oldest on-disk price still worth showing
+FAILED_TICKER_BACKOFF = 300  # Seconds before retrying a ticker Yahoo has no price for
+PRICE_WATCH_IDLE = 300  # Stop refreshing prices in the background after this long unrequested
+NUMPY_MIN_HOLDINGS = 16  # Vectorize the P&L math above this many holdings
+STREAM_POLL_INTERVAL = 5  # Seconds between change checks on /api/stream
+STREAM_HEARTBEAT = 15   # Seconds of silence before /api/stream sends a keep-alive
+TRADES_LIMIT = 50       # Most recent trades sent per refresh (the UI shows 50)
+REPORTS_LIMIT = 20      # Most recent reports sent per refresh (the UI shows the latest)
+HISTORY_MAX_POINTS = 300  # History records sent for the performance chart
+# yfinance's fast_info can hand back NumPy scalars, which orjson rejects by default
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# One keep-alive session for every Yahoo call (direct quotes and yfinance), so
+# repeat refreshes reuse pooled connections instead of a new TLS handshake each.
+# yfinance only accepts curl_cffi sessions, which also handle Yahoo's browser checks.
+_SESSION = curl_requests.Session(impersonate="chrome")
+# curl_cffi keeps one curl handle (and its open connections) per thread, so fetch
+# from long-lived worker threads; a pool per call would reconnect on every refresh
+_fetch_pool = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS, thread_name_prefix="yahoo")
+
+# ticker -> (price info, time.monotonic() when fetched)
+_price_cache = {}
+# ticker -> Future for a fetch currently in progress (see get_live_prices)
+_inflight = {}
+_inflight_lock = threading.Lock()
+# ticker -> time.monotonic() of the last fetch where Yahoo had no price for it
+_failed_at = {}
+# ticker -> time.monotonic() of the last request for it (see _refresh_loop)
+_watched = {}
+_refresher = None
+_refresher_lock = threading.Lock()
+# ticker -> (price info, time.time() when fetched); mirrors PRICE_CACHE_FILE
+_disk_prices = {}
+_disk_lock = threading.Lock()
+# filepath -> ((st_mtime_ns, st_size), parsed data)
+_json_cache = {}
+# (load_json result for PORTFOLIO_FILE, that data with defaults and derived fields)
+_portfolio = None
 
 def load_json(filepath):
-    if os.path.exists(filepath):
-        with open(filepath, "r") as f:
-            return json.load(f)
-    return {}
+    """Load a JSON file, reusing the parsed result until the file changes on disk.
+       Callers must treat the returned data as read-only.
+    """
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return {}
+    
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _json_cache.get(filepath)
+    if cached and cached[0] == key:
+        return cached[1]
+    
+    with open(filepath, "rb") as f:
+        raw = f.read()
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # The bot writes with the stdlib encoder, which may emit NaN/Infinity
+        data = json.loads(raw)
+    _json_cache[filepath] = (key, data)
+    return data
+
+def downsample_history(history, max_points=None):
+    """Reduce history to at most max_points records with Largest-Triangle-Three-Buckets
+       on total_value, so the chart keeps its shape without plotting every bot run.
+       The first and last records (and the first S&P 500 reading) are always kept,
+       since the chart normalizes against them.
+    """
+    if max_points is None:
+        max_points = HISTORY_MAX_POINTS
+    n = len(history)
+    if n <= max_points or max_points < 3:
+        return history
+    
+    values = [h["total_value"] for h in history]
+    keep = [0]
+    bucket_size = (n - 2) / (max_points - 2)
+    a = 0
+    for i in range(max_points - 2):
+        # Average of the next bucket is the third corner of the triangle
+        avg_start = int((i + 1) * bucket_size) + 1
+        avg_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x = (avg_start + avg_end - 1) / 2
+        avg_y = sum(values[avg_start:avg_end]) / (avg_end - avg_start)
+        
+        # Pick the point in this bucket that forms the largest triangle
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = a, values[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        keep.append(best)
+        a = best
+    keep.append(n - 1)
+    
+    first_sp = next((i for i, h in enumerate(history) if h.get("sp500")), None)
+    if first_sp is not None and first_sp not in keep:
+        keep.append(first_sp)
+        keep.sort()
+    return [history[i] for i in keep]
+
+def history_series(history):
+    """Column-wise (struct-of-arrays) view of history records for the chart."""
+    return {
+        "dates": [h["date"] for h in history],
+        "totals": [h["total_value"] for h in history],
+        "sp500": [h.get("sp500") for h in history],
+    }
 
 def load_portfolio():
-    data = load_json(PORTFOLIO_FILE)
-    # Ensure default structure
+    global _portfolio
+    raw = load_json(PORTFOLIO_FILE)
+    # load_json hands back the same dict until portfolio.json changes, so defaults
+    # and derived fields only need filling in the first time a version is seen
+    cached = _portfolio
+    if cached and cached[0] is raw:
+        return cached[1]
+    
+    # Ensure default structure. Merging builds a new dict, so load_json's shared
+    # result (which must stay read-only) is left untouched
     defaults = {
         "cash": 50000.0, 
         "holdings": {}, 
@@ -30,9 +190,25 @@ def load_portfolio():
         "reports": [],
         "market_mood": "Neutral"
     }
-    for k, v in defaults.items():
-        if k not in data:
-            data[k] = v
+    data = defaults | raw
+    
+    # Open positions and average cost only change when the bot trades
+    positions = [(t, s) for t, s in data["holdings"].items() if s > 0]
+    data["avg_cost"] = {
+        ticker: data["cost_basis"].get(ticker, 0) / shares
+        for ticker, shares in positions
+    }
+    data["total_cost_basis"] = sum(data["cost_basis"].get(t, 0) for t, _ in positions)
+    # Column arrays for _build_holdings_np, so requests only need to build the price columns
+    data["position_arrays"] = {
+        "shares": np.array([s for _, s in positions], dtype=np.float64),
+        "cost_basis": np.array([data["cost_basis"].get(t, 0) for t, _ in positions], dtype=np.float64),
+        "avg_cost": np.array([data["avg_cost"][t] for t, _ in positions], dtype=np.float64),
+    }
+    data["history_series"] = history_series(downsample_history(data["history"]))
+    data["positions"] = positions
+    # One assignment, so other threads see either the old pair or the finished new one
+    _portfolio = (raw, data)
     return data
 
 def load_news_memory():
@@ -41,60 +217,474 @@ def load_news_memory():
         return data
     return []
 
-def get_live_prices(tickers):
+def _fetch_price(stock):
+    """Fetch price and previous close for a single yf.Ticker.
+       Returns: {'price': 150.0, 'prev_close': 148.0} or None
+    """
+    price = None
+    prev_close = None
+    
+    # 1. Try fast_info (most reliable)
+    if hasattr(stock, 'fast_info'):
+        try:
+            info = stock.fast_info
+            p = info.last_price
+            pc = info.previous_close # strict snake_case for property access usually
+            
+            if p is not None:
+                price = p
+            if pc is not None:
+                prev_close = pc
+        except Exception:
+            pass
+    
+    # 2. Key Error or None? Try history (slower but fallback)
+    if price is None:
+        try:
+            hist = stock.history(period="2d", interval="1m") # need 2d for prev close potentially
+            if not hist.empty:
+                price = float(hist['Close'].iloc[-1])
+                # If we have 2 days, we might find prev close, otherwise use Open of today?
+                # This is tricky with 1m data for just today.
+                # Let's just trust fast_info for prev_close mostly.
+                # For fallback, maybe just omit day change.
+        except Exception:
+            pass
+    
+    if price is None:
+        return None
+    return {
+        'price': round(price, 2),
+        'prev_close': round(prev_close, 2) if prev_close else None
+    }
+
+def _quote_chunk(chunk):
+    """One request to Yahoo's spark endpoint for up to QUOTE_CHUNK_SIZE symbols.
+       Unlike the v7 quote API this needs no cookie/crumb handshake.
+       Returns (prices, symbols Yahoo answered for without a price).
+    """
+    data = {}
+    requested = {t.upper(): t for t in chunk}
+    params = {"symbols": ",".join(chunk), "range": "1d", "interval": "1d"}
+    try:
+        resp = _SESSION.get(YAHOO_SPARK_URL, params=params, timeout=QUOTE_TIMEOUT)
+        resp.raise_for_status()
+        results = orjson.loads(resp.content)["spark"]["result"] or []
+    except Exception as e:
+        print(f"Quote request failed for {chunk}: {e}")
+        # Says nothing about the symbols themselves, so none count as unpriceable
+        return data, []
+    
+    for result in results:
+        try:
+            meta = result["response"][0]["meta"]
+            price = meta["regularMarketPrice"]
+        except (KeyError, IndexError, TypeError):
+            continue
+        if price is None:
+            continue
+        
+        prev_close = meta.get("previousClose") or meta.get("chartPreviousClose")
+        data[requested.get(result["symbol"], result["symbol"])] = {
+            'price': round(price, 2),
+            'prev_close': round(prev_close, 2) if prev_close else None
+        }
+    return data, [t for t in chunk if t not in data]
+
+def _quote_prices(tickers):
+    """Fetch prices straight from Yahoo, one request per chunk of symbols.
+       Returns (prices, symbols Yahoo answered for without a price).
+    """
+    chunks = [tickers[i:i + QUOTE_CHUNK_SIZE] for i in range(0, len(tickers), QUOTE_CHUNK_SIZE)]
+    if len(chunks) == 1:
+        return _quote_chunk(chunks[0])
+    
+    # Large portfolios need several requests; have them in flight at the same time
+    data = {}
+    unpriced = []
+    try:
+        # The pool is shared, so a chunk may queue behind other fetches; give up on
+        # it rather than hold the request (the next tiers still get a go)
+        for prices, chunk_unpriced in _fetch_pool.map(_quote_chunk, chunks, timeout=FETCH_TIMEOUT):
+            data.update(prices)
+            unpriced.extend(chunk_unpriced)
+    except FuturesTimeoutError:
+        print(f"Warning: Timed out on quote requests for {len(tickers)} tickers")
+    return data, unpriced
+
+def _download_prices(tickers):
+    """Fetch prices for many tickers with a single yf.download call.
+       Tickers missing from the response are simply left out of the result.
+    """
+    import yfinance as yf
+    
+    data = {}
+    try:
+        # Daily bars: last close is the live price, the one before is prev close.
+        # yf.download still hits one chart URL per symbol, so let it run them in parallel.
+        df = yf.download(tickers, period="5d", interval="1d", progress=False,
+                         threads=True, group_by='ticker', session=_SESSION)
+    except Exception as e:
+        print(f"Batch download failed for {tickers}: {e}")
+        return data
+    if df is None or df.empty:
+        return data
+    
+    for ticker in tickers:
+        try:
+            closes = df[ticker]['Close'].dropna()
+        except KeyError:
+            continue
+        if closes.empty:
+            continue
+        
+        price = float(closes.iloc[-1])
+        prev_close = float(closes.iloc[-2]) if len(closes) > 1 else None
+        data[ticker] = {
+            'price': round(price, 2),
+            'prev_close': round(prev_close, 2) if prev_close else None
+        }
+    return data
+
+def _fetch_prices(tickers):
+    """Fetch prices for tickers, bypassing the cache. Cheapest source first.
+       Returns (prices, tickers Yahoo says it has no price for). Tickers lost to
+       network errors or timeouts are in neither.
+    """
+    # 1. One plain JSON request per chunk of symbols instead of one per ticker
+    fetched, unpriced = _quote_prices(tickers)
+    missing = [t for t in tickers if t not in fetched]
+    
+    # 2. Anything Yahoo didn't answer for goes through yfinance's batched download
+    if missing:
+        fetched.update(_download_prices(missing))
+        missing = [t for t in tickers if t not in fetched]
+    
+    # 3. Fall back to per-ticker fast_info for anything the batch missed.
+    # Each ticker is its own HTTPS round-trip, so fetch them concurrently
+    if missing:
+        # Imported lazily: yfinance (and pandas) add noticeably to process startup
+        import yfinance as yf
+        # Without an explicit session every yf.Ticker opens a fresh one
+        stocks = yf.Tickers(missing, session=_SESSION).tickers
+        futures = {_fetch_pool.submit(_fetch_price, stocks[ticker.upper()]): ticker for ticker in missing}
+        try:
+            for future in as_completed(futures, timeout=FETCH_TIMEOUT):
+                ticker = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Error fetching {ticker}: {e}")
+                    continue
+                
+                if result is not None:
+                    fetched[ticker] = result
+                else:
+                    print(f"Warning: Could not fetch price for {ticker}")
+        except FuturesTimeoutError:
+            # Don't let one hung ticker hold up the response; stragglers finish in the
+            # background and anything not started yet is dropped
+            slow = [t for f, t in futures.items() if not f.done()]
+            print(f"Warning: Timed out fetching {slow}")
+            for future in futures:
+                future.cancel()
+    
+    # Only trust a "no price" that came back in a successful response (e.g. a
+    # delisted symbol); an outage would otherwise back off every holding
+    unpriced = set(unpriced)
+    return fetched, [t for t in tickers if t in unpriced and t not in fetched]
+
+def _read_disk_prices():
+    """PRICE_CACHE_FILE as { 'TICKER': (info, time.time() when fetched) }, skipping bad entries."""
+    try:
+        with open(PRICE_CACHE_FILE, "rb") as f:
+            saved = orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        # Only a cache: an unreadable or corrupt file just means starting cold
+        print(f"Warning: Could not read price cache: {e}")
+        return {}
+    if not isinstance(saved, dict):
+        return {}
+    
+    prices = {}
+    for ticker, entry in saved.items():
+        # Hand-edited or from an older version: anything malformed is just not seeded
+        try:
+            info, fetched_at = entry
+            prev_close = info.get('prev_close')
+            info = {
+                'price': float(info['price']),
+                'prev_close': float(prev_close) if prev_close is not None else None
+            }
+            prices[ticker] = (info, float(fetched_at))
+        except (ValueError, TypeError, KeyError, AttributeError):
+            continue
+    return prices
+
+def load_disk_prices():
+    """Seed the price caches from PRICE_CACHE_FILE so a restart starts warm."""
+    now, now_mono = time.time(), time.monotonic()
+    for ticker, (info, fetched_at) in _read_disk_prices().items():
+        age = now - fetched_at
+        if age < PRICE_DISK_MAX_AGE:
+            _disk_prices[ticker] = (info, fetched_at)
+            # Keep the real age so the in-memory TTL still applies
+            _price_cache[ticker] = (info, now_mono - age)
+
+def save_disk_prices(fetched):
+    """Record freshly fetched prices in PRICE_CACHE_FILE and evict expired ones."""
+    fetched_at = time.time()
+    with _disk_lock:
+        # Other gunicorn workers share the file: keep whichever copy of each price is newer
+        for ticker, (info, saved_at) in _read_disk_prices().items():
+            current = _disk_prices.get(ticker)
+            if current is None or saved_at > current[1]:
+                _disk_prices[ticker] = (info, saved_at)
+        for ticker, info in fetched.items():
+            _disk_prices[ticker] = (info, fetched_at)
+        # Drop tickers nobody has asked for lately (e.g. sold positions) from both tiers
+        cutoff = fetched_at - PRICE_DISK_MAX_AGE
+        for ticker in [t for t, (_, ts) in _disk_prices.items() if ts < cutoff]:
+            del _disk_prices[ticker]
+            _price_cache.pop(ticker, None)
+        raw = orjson.dumps(_disk_prices, option=ORJSON_OPTIONS)
+        # Write then rename so a crash (or another worker) never sees a partial file
+        tmp_path = f"{PRICE_CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, PRICE_CACHE_FILE)
+        except OSError as e:
+            print(f"Warning: Could not save price cache: {e}")
+
+load_disk_prices()
+
+def _refresh_prices(tickers):
+    """Fetch tickers regardless of the TTL and store the results in the caches.
+       Returns: { 'TICKER': info or None }
+    """
+    # Single-flight: if another thread is already fetching a ticker, wait for
+    # its result instead of sending Yahoo a duplicate request
+    owned = []
+    waiting = {}
+    with _inflight_lock:
+        for ticker in tickers:
+            future = _inflight.get(ticker)
+            if future is None:
+                _inflight[ticker] = Future()
+                owned.append(ticker)
+            else:
+                waiting[ticker] = future
+    
+    fetched = {}
+    try:
+        if owned:
+            fetched, unpriceable = _fetch_prices(owned)
+            fetched_at = time.monotonic()
+            for ticker, info in fetched.items():
+                _price_cache[ticker] = (info, fetched_at)
+                _failed_at.pop(ticker, None)
+            if fetched:
+                save_disk_prices(fetched)
+            for ticker in unpriceable:
+                _failed_at[ticker] = fetched_at
+    finally:
+        with _inflight_lock:
+            for ticker in owned:
+                _inflight.pop(ticker).set_result(fetched.get(ticker))
+    
+    results = {ticker: fetched.get(ticker) for ticker in owned}
+    deadline = time.monotonic() + FETCH_TIMEOUT
+    for ticker, future in waiting.items():
+        try:
+            results[ticker] = future.result(timeout=max(0, deadline - time.monotonic()))
+        except FuturesTimeoutError:
+            # The other fetch is stuck; callers fall back to last-known prices
+            results[ticker] = None
+    return results
+
+def _refresh_loop():
+    """Re-fetch recently requested tickers before their cache entries expire, so
+       requests are answered from memory instead of waiting on Yahoo.
+    """
+    interval = PRICE_CACHE_TTL / 4
+    while True:
+        time.sleep(interval)
+        now = time.monotonic()
+        due = []
+        for ticker, requested in list(_watched.items()):
+            if now - requested > PRICE_WATCH_IDLE:
+                # Nobody has looked at it lately (closed tabs, sold position)
+                _watched.pop(ticker, None)
+                continue
+            cached = _price_cache.get(ticker)
+            failed = _failed_at.get(ticker)
+            if failed is not None and now - failed < FAILED_TICKER_BACKOFF:
+                continue
+            # Only entries that would expire before the next wake-up, so each ticker
+            # is fetched about once per TTL, not more often than requests would
+            if not cached or now - cached[1] >= PRICE_CACHE_TTL - interval:
+                due.append(ticker)
+        if due:
+            try:
+                _refresh_prices(due)
+            except Exception as e:
+                print(f"Background price refresh failed: {e}")
+
+def _watch(tickers):
+    global _refresher
+    now = time.monotonic()
+    for ticker in tickers:
+        _watched[ticker] = now
+    if _refresher is None:
+        with _refresher_lock:
+            # Started lazily so each gunicorn worker gets its own thread after forking
+            if _refresher is None:
+                _refresher = threading.Thread(target=_refresh_loop, daemon=True)
+                _refresher.start()
+
+def get_live_prices(tickers, cached_only=False):
     """Fetch current prices and day change for a list of tickers.
+       With cached_only, nothing is fetched: stale tickers get last-known prices.
        Returns: { 'TICKER': {'price': 150.0, 'prev_close': 148.0} }
     """
     data = {}
     if not tickers:
         return data
+    # Keep these warm in the background for as long as they keep being asked for
+    _watch(tickers)
     
-    # We iterate individually because yf.download can be fragile
+    # 0. Serve anything fetched within the TTL straight from the cache
+    now = time.monotonic()
+    stale = []
+    backing_off = []
     for ticker in tickers:
-        try:
-            stock = yf.Ticker(ticker)
-            price = None
-            prev_close = None
-            
-            # 1. Try fast_info (most reliable)
-            if hasattr(stock, 'fast_info'):
-                try:
-                    info = stock.fast_info
-                    p = info.last_price
-                    pc = info.previous_close # strict snake_case for property access usually
-                    
-                    if p is not None:
-                        price = p
-                    if pc is not None:
-                        prev_close = pc
-                except:
-                    pass
-            
-            # 2. Key Error or None? Try history (slower but fallback)
-            if price is None:
-                try:
-                    hist = stock.history(period="2d", interval="1m") # need 2d for prev close potentially
-                    if not hist.empty:
-                        price = float(hist['Close'].iloc[-1])
-                        # If we have 2 days, we might find prev close, otherwise use Open of today?
-                        # This is tricky with 1m data for just today.
-                        # Let's just trust fast_info for prev_close mostly.
-                        # For fallback, maybe just omit day change.
-                except:
-                    pass
-            
-            if price is not None:
-                data[ticker] = {
-                    'price': round(price, 2),
-                    'prev_close': round(prev_close, 2) if prev_close else None
-                }
+        cached = _price_cache.get(ticker)
+        failed = _failed_at.get(ticker)
+        if cached and now - cached[1] < PRICE_CACHE_TTL:
+            data[ticker] = cached[0]
+        elif failed is not None and now - failed < FAILED_TICKER_BACKOFF:
+            # Nothing could price it recently (e.g. delisted): don't walk every
+            # fallback tier for it again on each refresh
+            backing_off.append(ticker)
+        else:
+            stale.append(ticker)
+    if not stale and not backing_off:
+        return data
+    
+    unpriced = list(backing_off)
+    if cached_only:
+        unpriced.extend(stale)
+    elif stale:
+        for ticker, info in _refresh_prices(stale).items():
+            if info is not None:
+                data[ticker] = info
             else:
-                print(f"Warning: Could not fetch price for {ticker}")
+                unpriced.append(ticker)
+    
+    # Yahoo unreachable: fall back to a recent last-known price from disk
+    now = time.time()
+    for ticker in unpriced:
+        saved = _disk_prices.get(ticker)
+        if saved and now - saved[1] < PRICE_DISK_MAX_AGE:
+            data[ticker] = saved[0]
+    return data
 
-        except Exception as e:
-            print(f"Error fetching {ticker}: {e}")
+def _build_holdings_py(portfolio, live_data):
+    """Per-holding P&L rows plus invested/P&L totals, computed row by row."""
+    holdings_data = []
+    total_invested = 0
+    total_pl = 0
+    cost_basis = portfolio["cost_basis"]
+    avg_costs = portfolio["avg_cost"]
+    get_live = live_data.get
+    
+    for ticker, shares in portfolio["positions"]:
+        info = get_live(ticker, {})
+        current_price = info.get('price', 0)
+        prev_close = info.get('prev_close', None)
         
-    return data
+        cost_basis_total = cost_basis.get(ticker, 0)
+        avg_cost = avg_costs[ticker]
+        
+        # If fetch failed, fallback
+        if current_price == 0:
+            current_price = avg_cost 
+
+        market_val = shares * current_price
+        pl = market_val - cost_basis_total
+        pl_pct = (pl / cost_basis_total) * 100 if cost_basis_total > 0 else 0
+        
+        # Day Change Calculation
+        day_change_pct = 0
+        if prev_close and prev_close > 0:
+            day_change_pct = ((current_price - prev_close) / prev_close) * 100
+        
+        holdings_data.append({
+            "ticker": ticker,
+            "shares": shares,
+            "avg_cost": avg_cost,
+            "current_price": current_price,
+            "market_value": market_val,
+            "pl": pl,
+            "pl_pct": pl_pct,
+            "day_change_pct": day_change_pct
+        })
+        
+        total_invested += market_val
+        total_pl += pl
+    
+    return holdings_data, total_invested, total_pl
+
+def _build_holdings_np(portfolio, live_data):
+    """Same as _build_holdings_py, but does the arithmetic on NumPy arrays."""
+    positions = portfolio["positions"]
+    n = len(positions)
+    infos = [live_data.get(t, {}) for t, _ in positions]
+    
+    arrays = portfolio["position_arrays"]
+    shares = arrays["shares"]
+    cost_basis = arrays["cost_basis"]
+    avg_cost = arrays["avg_cost"]
+    price = np.fromiter((i.get('price', 0) for i in infos), dtype=np.float64, count=n)
+    prev_close = np.fromiter((i.get('prev_close') or 0 for i in infos), dtype=np.float64, count=n)
+    
+    # If fetch failed, fallback
+    price = np.where(price == 0, avg_cost, price)
+    market_val = shares * price
+    pl = market_val - cost_basis
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pl_pct = np.where(cost_basis > 0, pl / cost_basis * 100, 0.0)
+        day_change_pct = np.where(prev_close > 0, (price - prev_close) / prev_close * 100, 0.0)
+    
+    columns = zip(avg_cost.tolist(), price.tolist(), market_val.tolist(),
+                  pl.tolist(), pl_pct.tolist(), day_change_pct.tolist())
+    holdings_data = [
+        {
+            "ticker": ticker,
+            "shares": s,
+            "avg_cost": avg,
+            "current_price": px,
+            "market_value": mv,
+            "pl": p,
+            "pl_pct": pp,
+            "day_change_pct": dc
+        }
+        for (ticker, s), (avg, px, mv, p, pp, dc) in zip(positions, columns)
+    ]
+    return holdings_data, float(market_val.sum()), float(pl.sum())
+
+def build_holdings(portfolio, live_data):
+    """Returns (holdings_data, total_invested, total_pl) for the API payload."""
+    if not portfolio["positions"]:
+        return [], 0, 0
+    
+    # NumPy's per-call overhead only pays off once there are enough positions
+    if len(portfolio["positions"]) > NUMPY_MIN_HOLDINGS:
+        return _build_holdings_np(portfolio, live_data)
+    return _build_holdings_py(portfolio, live_data)
 
 DASHBOARD_HTML = """
 <!DOCTYPE html>
@@ -103,54 +693,62 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>EscherBot Dashboard 2.0</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;700&display=swap" rel="stylesheet">
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
+    <!-- Prebuilt from tailwind.css; only the classes this page uses -->
+    <link rel="stylesheet" href="/static/dashboard.css">
+    <!-- Charts are drawn after the first data fetch, so don't block first paint on them -->
+    <script defer src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
     <style>
-        :root {
-            --bg-dark: #0B0E14;
-            --bg-panel: #151A25;
-            --bg-card: #1C2333;
-            --accent-blue: #3B82F6;
-            --accent-green: #10B981;
-            --accent-red: #EF4444;
-            --accent-purple: #8B5CF6;
-            --text-main: #F3F4F6;
-            --text-muted: #9CA3AF;
-        }
+        /* Layered below Tailwind's utilities so classes still override these */
+        @layer components {
+            :root {
+                --bg-dark: #0B0E14;
+                --bg-panel: #151A25;
+                --bg-card: #1C2333;
+                --accent-blue: #3B82F6;
+                --accent-green: #10B981;
+                --accent-red: #EF4444;
+                --accent-purple: #8B5CF6;
+                --text-main: #F3F4F6;
+                --text-muted: #9CA3AF;
+            }
         
-        body {
-            background-color: var(--bg-dark);
-            color: var(--text-main);
-            font-family: 'Inter', sans-serif;
-        }
+            body {
+                background-color: var(--bg-dark);
+                color: var(--text-main);
+                font-family: 'Inter', sans-serif;
+            }
         
-        .font-mono { font-family: 'JetBrains Mono', monospace; }
+            .font-mono { font-family: 'JetBrains Mono', monospace; }
         
-        /* Glassmorphism adjustments */
-        .glass-panel {
-            background: rgba(21, 26, 37, 0.95);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.05);
-        }
+            /* Glassmorphism adjustments */
+            .glass-panel {
+                background: rgba(21, 26, 37, 0.95);
+                backdrop-filter: blur(10px);
+                border: 1px solid rgba(255, 255, 255, 0.05);
+            }
         
-        .card-hover:hover {
-            border-color: rgba(59, 130, 246, 0.5);
-            box-shadow: 0 0 15px rgba(59, 130, 246, 0.1);
-        }
+            .card-hover:hover {
+                border-color: rgba(59, 130, 246, 0.5);
+                box-shadow: 0 0 15px rgba(59, 130, 246, 0.1);
+            }
         
-        .scroll-hide::-webkit-scrollbar { display: none; }
-        .scroll-hide { -ms-overflow-style: none; scrollbar-width: none; }
+            .scroll-hide::-webkit-scrollbar { display: none; }
+            .scroll-hide { -ms-overflow-style: none; scrollbar-width: none; }
         
-        /* Custom Scrollbar for visible lists */
-        ::-webkit-scrollbar { width: 6px; height: 6px; }
-        ::-webkit-scrollbar-track { background: var(--bg-dark); }
-        ::-webkit-scrollbar-thumb { background: #2D3748; border-radius: 3px; }
-        ::-webkit-scrollbar-thumb:hover { background: #4A5568; }
-
-        .mood-bullish { background: rgba(16, 185, 129, 0.15); color: #34D399; border: 1px solid rgba(16, 185, 129, 0.3); }
-        .mood-bearish { background: rgba(239, 68, 68, 0.15); color: #F87171; border: 1px solid rgba(239, 68, 68, 0.3); }
-        .mood-neutral { background: rgba(139, 92, 246, 0.15); color: #A78BFA; border: 1px solid rgba(139, 92, 246, 0.3); }
+            /* Custom Scrollbar for visible lists */
+            ::-webkit-scrollbar { width: 6px; height: 6px; }
+            ::-webkit-scrollbar-track { background: var(--bg-dark); }
+            ::-webkit-scrollbar-thumb { background: #2D3748; border-radius: 3px; }
+            ::-webkit-scrollbar-thumb:hover { background: #4A5568; }
+
+            .mood-bullish { background: rgba(16, 185, 129, 0.15); color: #34D399; border: 1px solid rgba(16, 185, 129, 0.3); }
+            .mood-bearish { background: rgba(239, 68, 68, 0.15); color: #F87171; border: 1px solid rgba(239, 68, 68, 0.3); }
+            .mood-neutral { background: rgba(139, 92, 246, 0.15); color: #A78BFA; border: 1px solid rgba(139, 92, 246, 0.3); }
+        }
     </style>
 </head>
 <body class="min-h-screen pb-12">
@@ -335,6 +933,21 @@ DASHBOARD_HTML = """
                         <!-- Populated by JS -->
                         <div class="text-center text-gray-500 py-4">Scanning market...</div>
                     </div>
+                    <!-- One news card; cloned per item by renderNews -->
+                    <template id="news-card-tmpl">
+                        <div class="p-4 rounded-lg bg-[#151A25] border border-gray-800 hover:border-gray-700 transition-colors">
+                            <div class="flex justify-between items-start mb-2 gap-2">
+                                <div class="flex items-center gap-2">
+                                    <div data-f="heat"></div>
+                                    <span class="text-[10px] uppercase font-bold text-gray-400 tracking-wider" data-f="impact"></span>
+                                </div>
+                                <span class="text-[10px] text-gray-600" data-f="date"></span>
+                            </div>
+                            <h3 class="text-sm font-semibold text-gray-200 leading-snug mb-2" data-f="headline"></h3>
+                            <p class="text-xs text-gray-500 leading-relaxed mb-3" data-f="summary"></p>
+                            <div class="flex flex-wrap gap-1" data-f="tickers"></div>
+                        </div>
+                    </template>
                 </div>
 
             </div>
@@ -373,18 +986,38 @@ DASHBOARD_HTML = """
     <!-- MAIN SCRIPT -->
     <script>
         // --- UTILS ---
-        const fmtMoney = (n) => '$' + Number(n).toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
+        // Intl formatters are costly to build; create each once and reuse it per row
+        // (toLocaleString with options builds a fresh one on every call)
+        const MONEY_FMT = new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
+        const fmtMoney = (n) => '$' + MONEY_FMT.format(n);
         const fmtPct = (n) => (n >= 0 ? '+' : '') + n.toFixed(2) + '%';
         
+        const DATE_FMT = new Intl.DateTimeFormat();
+        const TRADE_FMT = new Intl.DateTimeFormat(undefined, { month:'short', day:'numeric', hour:'2-digit', minute:'2-digit' });
+        const REPORT_FMT = new Intl.DateTimeFormat(undefined, { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' });
+        const TIME_FMT = new Intl.DateTimeFormat(undefined, { timeStyle: 'medium' });
+        // format() throws on an invalid Date, unlike toLocaleString()
+        const fmtDate = (fmt, value) => { const d = new Date(value); return isNaN(d) ? '--' : fmt.format(d); };
+        
+        const BOLD_RE = /\\*\\*(.*?)\\*\\*/g;
+        const BOLD_MARK_RE = /\\*\\*/g;
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        const escapeHtml = (s) => String(s).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+        
         let allocChart = null;
         let histChart = null;
 
         // --- RENDER FUNCTIONS ---
 
         function renderAllocationChart(cash, invested) {
-            const ctx = document.getElementById('allocationChart').getContext('2d');
-            if (allocChart) allocChart.destroy();
+            // Reuse the chart across refreshes; only swap its data
+            if (allocChart) {
+                allocChart.data.datasets[0].data = [cash, invested];
+                allocChart.update('none');
+                return;
+            }
             
+            const ctx = document.getElementById('allocationChart').getContext('2d');
             allocChart = new Chart(ctx, {
                 type: 'doughnut',
                 data: {
@@ -409,23 +1042,24 @@ DASHBOARD_HTML = """
              const ctx = document.getElementById('historyChart').getContext('2d');
              
              // Normalize to % change from start
-             if (!history.length) return;
+             const { dates = [], totals = [], sp500 = [] } = history;
+             if (!totals.length) return;
              
-             const startVal = history[0].total_value;
-             let startSP = history[0].sp500 || 0;
+             const startVal = totals[0];
+             let startSP = sp500[0] || 0;
              
              // Find first valid SP500 value if missing in first record
              if (!startSP) {
-                 const firstWithSP = history.find(h => h.sp500);
-                 if (firstWithSP) startSP = firstWithSP.sp500;
+                 const firstSP = sp500.find(v => v);
+                 if (firstSP) startSP = firstSP;
              }
 
-             const labels = history.map(h => new Date(h.date).toLocaleDateString());
+             const labels = dates.map(d => fmtDate(DATE_FMT, d));
              
-             const dataPortfolio = history.map(h => ((h.total_value - startVal) / startVal) * 100);
-             const dataSP500 = history.map(h => {
-                 if (!h.sp500 || !startSP) return 0; // or null
-                 return ((h.sp500 - startSP) / startSP) * 100;
+             const dataPortfolio = totals.map(v => ((v - startVal) / startVal) * 100);
+             const dataSP500 = sp500.map(v => {
+                 if (!v || !startSP) return 0; // or null
+                 return ((v - startSP) / startSP) * 100;
              });
 
              // Calculate Alpha (latest)
@@ -440,7 +1074,15 @@ DASHBOARD_HTML = """
              badge.textContent = alpha >= 0 ? 'OUTPERFORMING' : 'UNDERPERFORMING';
              badge.className = `mt-2 text-[10px] font-bold px-2 py-0.5 rounded tracking-wider ${alpha >= 0 ? 'bg-green-500/10 text-green-400 border border-green-500/20' : 'bg-red-500/10 text-red-400 border border-red-500/20'}`;
              
-             if (histChart) histChart.destroy();
+             const pointRadius = totals.length > 60 ? 0 : 3;
+             if (histChart) {
+                 histChart.data.labels = labels;
+                 histChart.data.datasets[0].data = dataPortfolio;
+                 histChart.data.datasets[0].pointRadius = pointRadius;
+                 histChart.data.datasets[1].data = dataSP500;
+                 histChart.update('none');
+                 return;
+             }
 
              histChart = new Chart(ctx, {
                  type: 'line',
@@ -454,7 +1096,7 @@ DASHBOARD_HTML = """
                              backgroundColor: 'rgba(59, 130, 246, 0.1)',
                              fill: true,
                              tension: 0.4,
-                             pointRadius: 3,
+                             pointRadius: pointRadius,
                              borderWidth: 2
                          },
                          {
@@ -529,103 +1171,260 @@ DASHBOARD_HTML = """
             glowEl.className = `absolute -right-4 -top-4 w-32 h-32 rounded-full opacity-10 blur-2xl transition-colors duration-700 ${bgClass}`;
         }
 
+        // Update text/class only when they actually changed, so unchanged cells cost nothing
+        function setCell(el, text, className) {
+            if (el.textContent !== text) el.textContent = text;
+            if (className !== undefined && el.className !== className) el.className = className;
+        }
+
+        // Keep only keyed rows in a container (drops "Loading..."/empty placeholders)
+        function dropPlaceholders(container) {
+            for (const el of Array.from(container.children)) {
+                if (!el.dataset.key) el.remove();
+            }
+        }
+
+        // Only the first LAZY_EAGER items of a long list are built up front; the
+        // rest get a sized placeholder that is filled in when scrolled near view
+        const LAZY_EAGER = 10;
+        const lazyObserver = new IntersectionObserver(entries => entries.forEach(e => {
+            if (!e.isIntersecting) return;
+            const el = e.target;
+            lazyObserver.unobserve(el);
+            el.style.minHeight = '';
+            const fill = el.lazyFill;
+            // Already filled, or cancelled while this entry was queued
+            if (!fill) return;
+            el.lazyFill = null;
+            fill(el);
+        }), { rootMargin: '200px' });
+
+        function deferFill(el, fill, minHeight) {
+            el.lazyFill = fill;
+            el.style.minHeight = minHeight;
+            lazyObserver.observe(el);
+        }
+
+        function cancelFill(el) {
+            if (el.lazyFill) {
+                lazyObserver.unobserve(el);
+                el.lazyFill = null;
+            }
+        }
+
+        // Place `rows` in order inside `container` and remove rows whose key is not in `keep`
+        function syncRows(container, rowMap, rows, keep) {
+            for (const [key, row] of rowMap) {
+                if (!keep.has(key)) {
+                    cancelFill(row);
+                    row.remove();
+                    rowMap.delete(key);
+                }
+            }
+            rows.forEach((row, i) => {
+                if (container.children[i] !== row) container.insertBefore(row, container.children[i] || null);
+            });
+        }
+
+        const holdingRows = new Map(); // ticker -> <tr>
+
+        function createHoldingRow(ticker) {
+            const tr = document.createElement('tr');
+            tr.className = 'hover:bg-gray-800/30 transition-colors';
+            tr.dataset.key = ticker;
+            tr.innerHTML = `
+                <td class="px-6 py-4">
+                    <div class="font-bold text-blue-400" data-f="ticker"></div>
+                </td>
+                <td class="px-6 py-4 text-right font-mono text-gray-300" data-f="shares"></td>
+                <td class="px-6 py-4 text-right font-mono text-gray-400" data-f="avg"></td>
+                <td class="px-6 py-4 text-right font-mono text-gray-200" data-f="price"></td>
+                <td data-f="day"></td>
+                <td class="px-6 py-4 text-right font-mono text-gray-300" data-f="port"></td>
+                <td class="px-6 py-4 text-right">
+                    <div class="flex flex-col items-end">
+                        <span data-f="pl"></span>
+                        <span data-f="plpct"></span>
+                    </div>
+                </td>`;
+            tr.fields = {};
+            tr.querySelectorAll('[data-f]').forEach(el => { tr.fields[el.dataset.f] = el; });
+            tr.fields.ticker.textContent = ticker;
+            return tr;
+        }
+
         function renderHoldings(holdings, totalValue) {
             const container = document.getElementById('holdings-list');
             if (!holdings.length) {
+                holdingRows.clear();
                 container.innerHTML = `<tr><td colspan="6" class="px-6 py-8 text-center text-gray-500">
                     <div class="text-2xl mb-2">📭</div>
                     No holdings yet. Waiting for entry signals.
                 </td></tr>`;
                 return;
             }
+            dropPlaceholders(container);
             
-            container.innerHTML = holdings.map(h => {
+            const rows = holdings.map(h => {
+                let row = holdingRows.get(h.ticker);
+                if (!row) {
+                    row = createHoldingRow(h.ticker);
+                    holdingRows.set(h.ticker, row);
+                }
+                const c = row.fields;
                 const plColor = h.pl >= 0 ? 'text-green-400' : 'text-red-400';
-                const plBg = h.pl >= 0 ? 'bg-green-500/10' : 'bg-red-500/10';
                 const pctPort = totalValue > 0 ? (h.market_value / totalValue) * 100 : 0;
-                
                 const dayChgColor = h.day_change_pct >= 0 ? 'text-green-400' : 'text-red-400';
                 
-                return `<tr class="hover:bg-gray-800/30 transition-colors">
-                    <td class="px-6 py-4">
-                        <div class="font-bold text-blue-400">${h.ticker}</div>
-                    </td>
-                    <td class="px-6 py-4 text-right font-mono text-gray-300">${h.shares}</td>
-                    <td class="px-6 py-4 text-right font-mono text-gray-400">${fmtMoney(h.avg_cost)}</td>
-                    <td class="px-6 py-4 text-right font-mono text-gray-200">${fmtMoney(h.current_price)}</td>
-                    <td class="px-6 py-4 text-right font-mono ${dayChgColor}">${fmtPct(h.day_change_pct)}</td>
-                    <td class="px-6 py-4 text-right font-mono text-gray-300">${fmtPct(pctPort)}</td>
-                    <td class="px-6 py-4 text-right">
-                        <div class="flex flex-col items-end">
-                            <span class="${plColor} font-bold font-mono">${fmtMoney(h.pl)}</span>
-                            <span class="${plColor} text-xs">${fmtPct(h.pl_pct)}</span>
-                        </div>
-                    </td>
-                </tr>`;
-            }).join('');
+                setCell(c.shares, String(h.shares));
+                setCell(c.avg, fmtMoney(h.avg_cost));
+                setCell(c.price, fmtMoney(h.current_price));
+                setCell(c.day, fmtPct(h.day_change_pct), `px-6 py-4 text-right font-mono ${dayChgColor}`);
+                setCell(c.port, fmtPct(pctPort));
+                setCell(c.pl, fmtMoney(h.pl), `${plColor} font-bold font-mono`);
+                setCell(c.plpct, fmtPct(h.pl_pct), `${plColor} text-xs`);
+                return row;
+            });
+            syncRows(container, holdingRows, rows, new Set(holdings.map(h => h.ticker)));
+        }
+
+        const tradeRows = new Map(); // date|ticker|action|quantity|price|n -> <div>
+
+        function fillTradeRow(div, t) {
+            const isBuy = t.action === 'BUY';
+            const badgeClass = isBuy ? 'bg-green-500/10 text-green-400 border-green-500/20' : 'bg-red-500/10 text-red-400 border-red-500/20';
+            const date = fmtDate(TRADE_FMT, t.date);
+            
+            div.innerHTML = `
+                <div class="flex justify-between items-start mb-1">
+                    <div class="flex items-center gap-3">
+                        <span class="px-2 py-0.5 rounded text-[10px] font-bold border ${badgeClass}" data-f="action"></span>
+                        <span class="font-bold text-gray-200" data-f="ticker"></span>
+                        <span class="text-xs text-gray-500" data-f="qty"></span>
+                    </div>
+                    <span class="text-xs text-gray-600 font-mono" data-f="date"></span>
+                </div>
+                ${t.reason ? `<div class="mt-2 text-xs text-gray-500 leading-relaxed pl-2 border-l-2 border-gray-800" data-f="reason"></div>` : ''}`;
+            div.querySelector('[data-f="action"]').textContent = t.action;
+            div.querySelector('[data-f="ticker"]').textContent = t.ticker;
+            div.querySelector('[data-f="qty"]').textContent = `${t.quantity} @ ${fmtMoney(t.price)}`;
+            div.querySelector('[data-f="date"]').textContent = date;
+            if (t.reason) div.querySelector('[data-f="reason"]').textContent = t.reason;
+        }
+
+        function createTradeRow(key, t, lazy) {
+            // Trades never change once written, so each row is built exactly once
+            const div = document.createElement('div');
+            div.className = 'px-6 py-4 hover:bg-gray-800/30 transition-colors group';
+            div.dataset.key = key;
+            if (lazy) deferFill(div, el => fillTradeRow(el, t), '3.5rem');
+            else fillTradeRow(div, t);
+            return div;
         }
 
         function renderTrades(trades) {
             const container = document.getElementById('trade-history-list');
             if (!trades.length) {
+                tradeRows.forEach(cancelFill);
+                tradeRows.clear();
                 container.innerHTML = '<div class="px-6 py-8 text-center text-gray-500">No trades yet.</div>';
                 return;
             }
+            dropPlaceholders(container);
             
             // Show last 50
             const recent = trades.slice().reverse().slice(0, 50);
+            // The bot can make the same trade twice in a day; identical trades render
+            // identically, so counting repeats is enough to give each its own row
+            const seen = new Map();
+            const keys = recent.map(t => {
+                const base = `${t.date}|${t.ticker}|${t.action}|${t.quantity}|${t.price}`;
+                const n = seen.get(base) || 0;
+                seen.set(base, n + 1);
+                return `${base}|${n}`;
+            });
             
-            container.innerHTML = recent.map(t => {
-                const isBuy = t.action === 'BUY';
-                const badgeClass = isBuy ? 'bg-green-500/10 text-green-400 border-green-500/20' : 'bg-red-500/10 text-red-400 border-red-500/20';
-                const date = new Date(t.date).toLocaleString(undefined, { month:'short', day:'numeric', hour:'2-digit', minute:'2-digit' });
-                
-                return `<div class="px-6 py-4 hover:bg-gray-800/30 transition-colors group">
-                    <div class="flex justify-between items-start mb-1">
-                        <div class="flex items-center gap-3">
-                            <span class="px-2 py-0.5 rounded text-[10px] font-bold border ${badgeClass}">${t.action}</span>
-                            <span class="font-bold text-gray-200">${t.ticker}</span>
-                            <span class="text-xs text-gray-500">${t.quantity} @ ${fmtMoney(t.price)}</span>
-                        </div>
-                        <span class="text-xs text-gray-600 font-mono">${date}</span>
-                    </div>
-                    ${t.reason ? `
-                    <div class="mt-2 text-xs text-gray-500 leading-relaxed pl-2 border-l-2 border-gray-800">
-                        ${t.reason}
-                    </div>` : ''}
-                </div>`;
-            }).join('');
+            const rows = recent.map((t, i) => {
+                let row = tradeRows.get(keys[i]);
+                if (!row) {
+                    row = createTradeRow(keys[i], t, i >= LAZY_EAGER);
+                    tradeRows.set(keys[i], row);
+                }
+                return row;
+            });
+            syncRows(container, tradeRows, rows, new Set(keys));
+        }
+
+        const newsCardTmpl = document.getElementById('news-card-tmpl');
+        const TICKER_CHIP_CLASS = 'px-1.5 py-0.5 rounded bg-gray-800 text-gray-400 text-[10px] border border-gray-700';
+        // Heat dot class per importance 0-10: blue below 6, orange below 8, red from 8
+        const HEAT_DOT_CLASS = Object.freeze(Array.from({ length: 11 }, (_, i) =>
+            `w-1.5 h-1.5 rounded-full ${i >= 8 ? 'bg-red-500' : (i >= 6 ? 'bg-orange-500' : 'bg-blue-500')}`));
+
+        // Clone the card skeleton and fill it with text, so news is never parsed as HTML
+        function createNewsCard(n) {
+            const el = newsCardTmpl.content.firstElementChild.cloneNode(true);
+            const f = {};
+            el.querySelectorAll('[data-f]').forEach(node => { f[node.dataset.f] = node; });
+            f.heat.className = HEAT_DOT_CLASS[Math.min(10, Math.max(0, n.importance | 0))];
+            f.impact.textContent = `Impact: ${n.importance}/10`;
+            f.date.textContent = n.date;
+            f.headline.textContent = n.headline;
+            f.summary.textContent = n.summary;
+            if (n.tickers && n.tickers.length) {
+                for (const t of n.tickers) {
+                    const chip = document.createElement('span');
+                    chip.className = TICKER_CHIP_CLASS;
+                    chip.textContent = t;
+                    f.tickers.appendChild(chip);
+                }
+            } else {
+                f.tickers.remove();
+            }
+            return el;
         }
 
+        const newsCards = new Map(); // importance|date|headline -> card
+
         function renderNews(news) {
             const container = document.getElementById('news-feed');
             if (!news || !news.length) {
+                newsCards.forEach(cancelFill);
+                newsCards.clear();
                 container.innerHTML = '<div class="text-center text-gray-500 py-4">No news in memory.</div>';
                 return;
             }
+            dropPlaceholders(container);
             
             // Sort by importance
             const sorted = news.slice().sort((a,b) => b.importance - a.importance);
+            const keys = new Set();
             
-            container.innerHTML = sorted.map(n => {
-                const heat = n.importance >= 8 ? 'bg-red-500' : (n.importance >= 6 ? 'bg-orange-500' : 'bg-blue-500');
-                return `<div class="p-4 rounded-lg bg-[#151A25] border border-gray-800 hover:border-gray-700 transition-colors">
-                    <div class="flex justify-between items-start mb-2 gap-2">
-                        <div class="flex items-center gap-2">
-                            <div class="w-1.5 h-1.5 rounded-full ${heat}"></div>
-                            <span class="text-[10px] uppercase font-bold text-gray-400 tracking-wider">Impact: ${n.importance}/10</span>
-                        </div>
-                        <span class="text-[10px] text-gray-600">${n.date}</span>
-                    </div>
-                    <h3 class="text-sm font-semibold text-gray-200 leading-snug mb-2">${n.headline}</h3>
-                    <p class="text-xs text-gray-500 leading-relaxed mb-3">${n.summary}</p>
-                    ${n.tickers && n.tickers.length ? `
-                        <div class="flex flex-wrap gap-1">
-                            ${n.tickers.map(t => `<span class="px-1.5 py-0.5 rounded bg-gray-800 text-gray-400 text-[10px] border border-gray-700">${t}</span>`).join('')}
-                        </div>
-                    ` : ''}
-                </div>`;
-            }).join('');
+            // Cards are only built for items that are new since the last render
+            const rows = [];
+            for (const n of sorted) {
+                const key = `${n.importance}|${n.date}|${n.headline}`;
+                if (keys.has(key)) continue;
+                keys.add(key);
+                let card = newsCards.get(key);
+                if (!card) {
+                    if (rows.length < LAZY_EAGER) {
+                        card = createNewsCard(n);
+                    } else {
+                        card = document.createElement('div');
+                        deferFill(card, el => {
+                            const full = createNewsCard(n);
+                            full.dataset.key = key;
+                            el.replaceWith(full);
+                            newsCards.set(key, full);
+                        }, '8rem');
+                    }
+                    card.dataset.key = key;
+                    newsCards.set(key, card);
+                }
+                rows.push(card);
+            }
+            syncRows(container, newsCards, rows, keys);
         }
 
         let latestReportData = null;
@@ -633,10 +1432,10 @@ DASHBOARD_HTML = """
         function openModal() {
             if(!latestReportData) return;
             document.getElementById('modal-title').textContent = latestReportData.title;
-            document.getElementById('modal-date').textContent = new Date(latestReportData.date).toLocaleDateString(undefined, { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' });
+            document.getElementById('modal-date').textContent = fmtDate(REPORT_FMT, latestReportData.date);
             
-            // Convert markdown-ish bold to strong tags
-            let content = latestReportData.summary.replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>');
+            // Convert markdown-ish bold to strong tags (after escaping, so the report can't inject markup)
+            let content = escapeHtml(latestReportData.summary).replace(BOLD_RE, '<strong>$1</strong>');
             // Convert newlines to paragraphs
             content = content.split('\\n').filter(p => p.trim()).map(p => `<p class="mb-4">${p}</p>`).join('');
             
@@ -665,136 +1464,431 @@ DASHBOARD_HTML = """
             latestReportData = r;
             
             document.getElementById('report-title').textContent = r.title;
-            document.getElementById('report-date').textContent = new Date(r.date).toLocaleDateString();
-            document.getElementById('report-preview').textContent = r.summary.replace(/\*\*/g, ''); // strip markdown
+            document.getElementById('report-date').textContent = fmtDate(DATE_FMT, r.date);
+            document.getElementById('report-preview').textContent = r.summary.replace(BOLD_MARK_RE, ''); // strip markdown
             
             card.onclick = openModal;
             card.classList.remove('hidden');
         }
 
-        async function refresh() {
+        // `changed` lists the payload keys that differ from the last update (null: all of them)
+        function applyUpdate(data, changed) {
+            const has = (...keys) => !changed || keys.some(k => changed.has(k));
             try {
-                const res = await fetch('/api/portfolio');
-                const data = await res.json();
-                
                 // Top Bar / Stats
-                document.getElementById('total-equity').textContent = fmtMoney(data.total_value);
-                document.getElementById('total-pl-value').textContent = (data.total_pl >= 0 ? '+' : '') + fmtMoney(data.total_pl);
-                document.getElementById('total-pl-value').className = `text-2xl font-bold font-mono ${data.total_pl >= 0 ? 'text-green-400' : 'text-red-400'}`;
+                if (has('total_value', 'total_pl', 'total_pl_pct', 'invested_value', 'cash')) {
+                    document.getElementById('total-equity').textContent = fmtMoney(data.total_value);
+                    document.getElementById('total-pl-value').textContent = (data.total_pl >= 0 ? '+' : '') + fmtMoney(data.total_pl);
+                    document.getElementById('total-pl-value').className = `text-2xl font-bold font-mono ${data.total_pl >= 0 ? 'text-green-400' : 'text-red-400'}`;
                 
-                const plPct = data.invested_value > 0 ? (data.total_pl / (data.invested_value - data.total_pl)) * 100 : 0;
-                document.getElementById('total-pl-pct').textContent = fmtPct(plPct) + ' return on invested';
-                document.getElementById('total-pl-pct').className = `text-sm font-medium mt-1 ${plPct >= 0 ? 'text-green-500' : 'text-red-500'}`;
+                    const plPct = data.total_pl_pct || 0;
+                    document.getElementById('total-pl-pct').textContent = fmtPct(plPct) + ' return on invested';
+                    document.getElementById('total-pl-pct').className = `text-sm font-medium mt-1 ${plPct >= 0 ? 'text-green-500' : 'text-red-500'}`;
                 
-                document.getElementById('cash-val').textContent = fmtMoney(data.cash);
-                document.getElementById('invested-val').textContent = fmtMoney(data.invested_value);
-                document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
+                    document.getElementById('cash-val').textContent = fmtMoney(data.cash);
+                    document.getElementById('invested-val').textContent = fmtMoney(data.invested_value);
+                }
+                document.getElementById('last-update').textContent = TIME_FMT.format(new Date());
                 
-                if (data.sp500_price) {
-                    document.getElementById('sp500-val').textContent = fmtMoney(data.sp500_price);
-                } else {
-                    document.getElementById('sp500-val').textContent = "--";
+                if (has('sp500_price')) {
+                    if (data.sp500_price) {
+                        document.getElementById('sp500-val').textContent = fmtMoney(data.sp500_price);
+                    } else {
+                        document.getElementById('sp500-val').textContent = "--";
+                    }
                 }
 
-                renderAllocationChart(data.cash, data.invested_value);
-                updateMood(data.market_mood || 'Neutral');
-                renderHoldings(data.holdings, data.total_value);
-                renderTrades(data.trades);
-                renderNews(data.news_memory);
-                renderHistoryChart(data.history || []);
-                renderReportCard(data.reports);
+                if (has('cash', 'invested_value')) renderAllocationChart(data.cash, data.invested_value);
+                if (has('market_mood')) updateMood(data.market_mood || 'Neutral');
+                if (has('holdings', 'total_value')) renderHoldings(data.holdings, data.total_value);
+                if (has('trades')) renderTrades(data.trades);
+                if (has('news_memory')) renderNews(data.news_memory);
+                if (has('history')) renderHistoryChart(data.history || {});
+                if (has('reports')) renderReportCard(data.reports);
 
+            } catch (e) {
+                console.error("Render failed", e);
+            }
+        }
+
+        // Apply at most one update per frame (the newest), so every DOM write of a
+        // refresh lands before the next layout and hidden tabs don't render at all
+        let pendingUpdate = null;
+        let pendingChanged = null;
+        function scheduleUpdate(data, changed) {
+            const queued = pendingUpdate !== null;
+            if (!queued) pendingChanged = changed ? new Set(changed) : null;
+            else if (pendingChanged && changed) changed.forEach(k => pendingChanged.add(k));
+            else pendingChanged = null;
+            pendingUpdate = data;
+            if (queued) return;
+            requestAnimationFrame(() => {
+                const latest = pendingUpdate;
+                const keys = pendingChanged;
+                pendingUpdate = pendingChanged = null;
+                applyUpdate(latest, keys);
+            });
+        }
+
+        const POLL_MS = 30000;            // Poll interval when EventSource is unavailable
+        const POLL_MAX_MS = 120000;       // Backoff ceiling while data is unchanged or the tab is hidden
+        const STREAM_HIDDEN_MS = 60000;   // Drop the stream after the tab has been hidden this long
+        let lastEtag = null;
+
+        // Returns true when the server had new data
+        async function refresh() {
+            try {
+                const res = await fetch('/api/portfolio');
+                const etag = res.headers.get('ETag');
+                if (etag && etag === lastEtag) return false; // Revalidated: nothing new to render
+                lastEtag = etag;
+                scheduleUpdate(await res.json());
+                return true;
             } catch (e) {
                 console.error("Refresh failed", e);
+                return false;
             }
         }
 
-        // Init
-        refresh();
-        setInterval(refresh, 30000); // 30s auto refresh
+        let pollDelay = POLL_MS;
+        let pollTimer = null;
+        let polling = false;
+        async function poll() {
+            polling = true;
+            const changed = !document.hidden && await refresh();
+            polling = false;
+            // Back off while nothing changes; hidden tabs only check in at the ceiling
+            pollDelay = document.hidden ? POLL_MAX_MS : (changed ? POLL_MS : Math.min(pollDelay * 2, POLL_MAX_MS));
+            pollTimer = setTimeout(poll, pollDelay);
+        }
+
+        let stream = null;
+        let streamState = null;
+        function openStream() {
+            // Every (re)connect starts with a full snapshot; later messages are deltas on it
+            stream = new EventSource('/api/stream');
+            streamState = null;
+            stream.onmessage = (e) => {
+                const msg = JSON.parse(e.data);
+                if (!msg.delta) {
+                    streamState = msg;
+                    scheduleUpdate(streamState, null);
+                } else if (streamState) {
+                    Object.assign(streamState, msg.delta);
+                    scheduleUpdate(streamState, Object.keys(msg.delta));
+                }
+            };
+        }
+
+        // Init (after deferred scripts like Chart.js have run)
+        document.addEventListener('DOMContentLoaded', () => {
+            if (window.EventSource) {
+                // Server pushes a new snapshot only when something changed
+                openStream();
+                // Each open stream holds a server thread, so release it for long-hidden tabs
+                let hiddenTimer = null;
+                document.addEventListener('visibilitychange', () => {
+                    if (document.hidden) {
+                        hiddenTimer = setTimeout(() => { stream.close(); stream = null; }, STREAM_HIDDEN_MS);
+                    } else {
+                        clearTimeout(hiddenTimer);
+                        if (!stream) openStream();
+                    }
+                });
+            } else {
+                poll();
+                document.addEventListener('visibilitychange', () => {
+                    if (document.hidden || polling) return;
+                    // Back in view: refresh now instead of waiting out the backoff
+                    clearTimeout(pollTimer);
+                    pollDelay = POLL_MS;
+                    poll();
+                });
+            }
+        });
 
     </script>
 </body>
 </html>
 """
 
+# The page has no template variables, so there is nothing to render per request
+STATIC_INDEX_FILE = os.path.join(app.static_folder, "index.html")
+# Always revalidate (cheap, thanks to the ETag): a deploy can change the payload
+# or stream format the page expects
+INDEX_CACHE_CONTROL = "no-cache"
+
+def minify_html(html):
+    """Drop HTML comments, indentation and blank lines.
+       Line breaks are kept, so inline JS (// comments, semicolon-free lines) still parses.
+       Assumes no "<!--" inside <script> blocks.
+    """
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+def export_static_index():
+    """Write the minified DASHBOARD_HTML to static/index.html so a reverse proxy can serve it."""
+    page = minify_html(DASHBOARD_HTML)
+    try:
+        with open(STATIC_INDEX_FILE, "r", encoding="utf-8") as f:
+            if f.read() == page:
+                return
+    except FileNotFoundError:
+        pass
+    
+    os.makedirs(app.static_folder, exist_ok=True)
+    # Write then rename so concurrent workers never expose a half-written file
+    tmp_path = f"{STATIC_INDEX_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(page)
+    os.replace(tmp_path, STATIC_INDEX_FILE)
+
+export_static_index()
+
+# Fallback for running without a reverse proxy (e.g. the dev server)
+
 @app.route('/')
 def index():
-    return render_template_string(DASHBOARD_HTML)
+    # send_static_file streams the file and answers If-None-Match/If-Modified-Since itself
+    resp = app.send_static_file("index.html")
+    resp.headers["Cache-Control"] = INDEX_CACHE_CONTROL
+    return resp
 
-@app.route('/api/portfolio')
-def api_portfolio():
-    portfolio = load_portfolio()
-    news_memory = load_news_memory()
-    
-    tickers = list(portfolio["holdings"].keys())
-    # Add S&P 500 to fetch list
-    tickers_to_fetch = tickers + ["^GSPC"]
-    live_data = get_live_prices(tickers_to_fetch)
+def _mtime_ns(filepath):
+    try:
+        return os.stat(filepath).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def data_version():
+    """Changes whenever a data file is rewritten or the price cache window rolls over."""
+    price_window = int(time.time() // PRICE_CACHE_TTL)
+    return f"{_mtime_ns(PORTFOLIO_FILE)}:{_mtime_ns(NEWS_MEMORY_FILE)}:{price_window}"
+
+def portfolio_etag():
+    """ETag for /api/portfolio: the data version plus the requested view."""
+    key = f"{data_version()}:{request.full_path}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+def _etag_matches(etag):
+    # Flask-Compress tags compressed bodies as "<etag>:<algorithm>"
+    return any(tag.split(":", 1)[0] == etag for tag in request.if_none_match.as_set(include_weak=True))
+
+def _live_payload(portfolio, cached_only=False):
+    """The part of the payload that moves with prices."""
+    # Zero-share entries don't need a quote
+    tickers = [t for t, _ in portfolio["positions"]]
+    # Add S&P 500 to fetch list (once, even if it is also held)
+    tickers_to_fetch = list(dict.fromkeys(tickers + ["^GSPC"]))
+    live_data = get_live_prices(tickers_to_fetch, cached_only=cached_only)
     
     # Extract S&P 500 data
     sp500_info = live_data.get("^GSPC", {})
     sp500_price = sp500_info.get('price', 0)
     
-    holdings_data = []
-    total_invested = 0
-    total_pl = 0
-    
-    for ticker, shares in portfolio["holdings"].items():
-        if shares <= 0: continue
-        
-        info = live_data.get(ticker, {})
-        current_price = info.get('price', 0)
-        prev_close = info.get('prev_close', None)
-        
-        cost_basis_total = portfolio.get("cost_basis", {}).get(ticker, 0)
-        avg_cost = cost_basis_total / shares
-        
-        # If fetch failed, fallback
-        if current_price == 0:
-            current_price = avg_cost 
-
-        market_val = shares * current_price
-        pl = market_val - cost_basis_total
-        pl_pct = (pl / cost_basis_total) * 100 if cost_basis_total > 0 else 0
-        
-        # Day Change Calculation
-        day_change_pct = 0
-        if prev_close and prev_close > 0:
-            day_change_pct = ((current_price - prev_close) / prev_close) * 100
-        
-        holdings_data.append({
-            "ticker": ticker,
-            "shares": shares,
-            "avg_cost": avg_cost,
-            "current_price": current_price,
-            "market_value": market_val,
-            "pl": pl,
-            "pl_pct": pl_pct,
-            "day_change_pct": day_change_pct
-        })
-        
-        total_invested += market_val
-        total_pl += pl
-        
+    holdings_data, total_invested, total_pl = build_holdings(portfolio, live_data)
     total_value = portfolio["cash"] + total_invested
+    total_cost = portfolio["total_cost_basis"]
+    total_pl_pct = total_pl / total_cost * 100 if total_cost > 0 else 0
     
-    response = {
-        "cash": portfolio["cash"],
+    return {
         "total_value": total_value,
         "invested_value": total_invested,
         "total_pl": total_pl,
+        "total_pl_pct": total_pl_pct,
         "holdings": holdings_data,
-        "trades": portfolio.get("trades", []),
+        "sp500_price": sp500_price
+    }
+
+def _static_payload(portfolio, news_memory, full):
+    """The part of the payload that only changes when the bot rewrites its files."""
+    # Trades and reports grow forever; only ship the tail unless the full view is asked for.
+    # History is downsampled instead, since the chart needs its whole range
+    trades = portfolio["trades"]
+    reports = portfolio["reports"]
+    if not full:
+        trades = trades[-TRADES_LIMIT:]
+        reports = reports[-REPORTS_LIMIT:]
+    
+    return {
+        "cash": portfolio["cash"],
+        "trades": trades,
         "market_mood": portfolio.get("market_mood", "Neutral"),
         "news_memory": news_memory,
-        "history": portfolio.get("history", []),
-        "reports": portfolio.get("reports", []),
-        "sp500_price": sp500_price
+        "history": history_series(portfolio["history"]) if full else portfolio["history_series"],
+        "reports": reports
     }
+
+def build_payload(full=False):
+    """Assemble the dashboard payload (portfolio, live prices, news)."""
+    portfolio = load_portfolio()
+    payload = _live_payload(portfolio)
+    payload.update(_static_payload(portfolio, load_news_memory(), full))
+    return payload
+
+# full -> (portfolio, news_memory, serialized _static_payload) for the last files seen
+_static_json = {}
+
+def static_payload_json(portfolio, news_memory, full=False):
+    """Serialized _static_payload, reused until load_json hands back new file contents."""
+    cached = _static_json.get(full)
+    # A missing news file comes back as a fresh [] on every call
+    if cached and cached[0] is portfolio and (cached[1] is news_memory or not (cached[1] or news_memory)):
+        return cached[2]
+    body = orjson.dumps(_static_payload(portfolio, news_memory, full), option=ORJSON_OPTIONS)
+    _static_json[full] = (portfolio, news_memory, body)
+    return body
+
+def encode_payload(full=False, cached_only=False):
+    """build_payload() serialized, with only the price-dependent fields encoded afresh."""
+    portfolio = load_portfolio()
+    news_memory = load_news_memory()
+    live = orjson.dumps(_live_payload(portfolio, cached_only=cached_only), option=ORJSON_OPTIONS)
+    # Splice the two objects together: '{...live' + ',' + 'static...}'
+    return live[:-1] + b"," + static_payload_json(portfolio, news_memory, full)[1:]
+
+# ETag -> Future for the encoded body of a payload currently being built
+_payload_inflight = {}
+_payload_lock = threading.Lock()
+
+def encoded_payload(etag, full=False):
+    """Build and serialize the payload once per ETag, however many requests ask at once."""
+    with _payload_lock:
+        future = _payload_inflight.get(etag)
+        owner = future is None
+        if owner:
+            future = _payload_inflight[etag] = Future()
+    if not owner:
+        try:
+            return future.result(timeout=FETCH_TIMEOUT)
+        except FuturesTimeoutError:
+            # The shared build is stuck on Yahoo; answer from last-known prices
+            # rather than joining the same stuck fetch for another FETCH_TIMEOUT
+            return encode_payload(full=full, cached_only=True)
+    
+    try:
+        body = encode_payload(full=full)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(body)
+    finally:
+        with _payload_lock:
+            del _payload_inflight[etag]
+    return body
+
+@app.route('/api/portfolio')
+def api_portfolio():
+    # Nothing changed since the client's copy: skip price fetch and serialization
+    etag = portfolio_etag()
+    if _etag_matches(etag):
+        resp = app.response_class(status=304)
+        resp.set_etag(etag)
+        return resp
+    
+    # Tabs refreshing together share one build (and one price fetch) for this version
+    body = encoded_payload(etag, full=request.args.get("full") == "1")
+    
+    # orjson serializes straight to bytes, skipping Flask's pure-Python encoder
+    resp = app.response_class(body, mimetype='application/json')
+    resp.set_etag(etag)
+    # Let the browser keep the body but always revalidate it with If-None-Match
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+# SSE fan-out: one broadcaster thread builds each snapshot once and hands the
+# encoded bytes to every connected client's queue
+_subscribers = set()
+_stream_lock = threading.Lock()
+_stream_wakeup = threading.Event()
+_latest_message = None  # (data version, encoded SSE message)
+_broadcaster = None
+
+def _sse_message(data):
+    return b"data: " + orjson.dumps(data, option=ORJSON_OPTIONS) + b"\n\n"
+
+def _broadcast_loop():
+    """Build a payload whenever the data version moves and push it to every client.
+       Clients get the full snapshot once, then {"delta": {...}} with only the
+       top-level keys that changed since the previous snapshot.
+    """
+    global _latest_message
+    last_version = None
+    last_payload = None
+    while True:
+        with _stream_lock:
+            listening = bool(_subscribers)
+        if listening:
+            version = data_version()
+            if version != last_version:
+                try:
+                    payload = build_payload()
+                    full = _sse_message(payload)
+                    if last_payload is None:
+                        update = full
+                    else:
+                        delta = {k: v for k, v in payload.items() if last_payload.get(k) != v}
+                        # e.g. the price window rolled over but no quote moved
+                        update = _sse_message({"delta": delta}) if delta else None
+                except Exception as e:
+                    print(f"Stream update failed: {e}")
+                else:
+                    last_version = version
+                    last_payload = payload
+                    with _stream_lock:
+                        _latest_message = (version, full)
+                        if update:
+                            for q in _subscribers:
+                                q.put(update)
+        _stream_wakeup.wait(STREAM_POLL_INTERVAL)
+        _stream_wakeup.clear()
+
+def _subscribe():
+    global _broadcaster
+    q = queue.Queue()
+    with _stream_lock:
+        _subscribers.add(q)
+        latest = _latest_message
+        # Queued under the lock so the snapshot always precedes deltas built on it
+        if latest:
+            q.put(latest[1])
+        # Started lazily so each gunicorn worker gets its own thread after forking
+        if _broadcaster is None:
+            _broadcaster = threading.Thread(target=_broadcast_loop, daemon=True)
+            _broadcaster.start()
+    
+    if not latest or latest[0] != data_version():
+        _stream_wakeup.set()  # Snapshot missing or stale: build the next one now
+    return q
+
+def _unsubscribe(q):
+    with _stream_lock:
+        _subscribers.discard(q)
+
+@app.route('/api/stream')
+def api_stream():
+    """Server-Sent Events: a full payload on connect, then only what changed.
+       Each open stream holds one server thread for as long as the tab is open.
+    """
+    def generate():
+        q = _subscribe()
+        try:
+            while True:
+                try:
+                    yield q.get(timeout=STREAM_HEARTBEAT)
+                except queue.Empty:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield b": ping\n\n"
+        finally:
+            _unsubscribe(q)
     
-    return jsonify(response)
+    return app.response_class(generate(), mimetype='text/event-stream', headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # Don't let nginx buffer the stream
+    })
 
 if __name__ == '__main__':
     print("🚀 EscherBot Dashboard v2.0 running on http://localhost:5050")
-    app.run(host='0.0.0.0', port=5050, debug=True)
+    # Dev server only; use gunicorn (see module docstring) for real deployments
+    app.run(host='0.0.0.0', port=5050, debug=False, threaded=True)